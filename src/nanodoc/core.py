@@ -1,10 +1,16 @@
+import io
 import logging
 import os
-from typing import List, Optional, Tuple
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count, islice
+from operator import itemgetter
+from typing import Iterator, List, Optional, TextIO, Tuple
 
 from .data import (
+    READ_BUFFER_SIZE,
     ContentItem,
-    get_content,
+    LineRange,
     is_full_file,
     line_range_to_string,
     normalize_line_range,
@@ -14,19 +20,37 @@ from .formatting import apply_style_to_filename, create_header
 logger = logging.getLogger("nanodoc")
 logger.setLevel(logging.CRITICAL)  # Start with logging disabled
 
+# Files up to this size are read in one call instead of line by line
+SMALL_FILE_SIZE = 1 << 16
 
-def generate_table_of_contents(content_items: List[ContentItem], style=None):
+# Formats a (line number, line) pair as "  12: text"; %-formatting a tuple
+# is cheaper per call than str.format or an f-string
+LINE_NUMBER_FORMAT = "%4d: %s".__mod__
+
+# Files read ahead of the one being written when streaming without a TOC;
+# bounds memory to a few files while still overlapping their reads
+READ_AHEAD = 8
+
+
+def generate_table_of_contents(
+    content_items: List[ContentItem],
+    style=None,
+    line_counts: Optional[List[int]] = None,
+):
     """Generate a table of contents for the given ContentItems.
 
     Args:
         content_items (list): List of ContentItem objects
         style (str): The header style (filename, path, nice, or None)
+        line_counts (list, optional): Number of lines of each ContentItem, in
+                                      the same order. When omitted each item
+                                      is read with read_file to count them.
 
     Returns:
         tuple: (str, dict) The table of contents string and a dictionary
                mapping source files to their line numbers in the final document
     """
-    logger.debug(f"Generating table of contents for {len(content_items)} items")
+    logger.debug("Generating table of contents for %d items", len(content_items))
 
     # Calculate line numbers for TOC
     toc_line_numbers = {}
@@ -35,12 +59,15 @@ def generate_table_of_contents(content_items: List[ContentItem], style=None):
     # Calculate the size of the TOC header
     toc_header_lines = 2  # Header line + blank line
 
-    # Group ContentItems by file path
-    file_groups = {}
-    for item in content_items:
-        if item.file_path not in file_groups:
-            file_groups[item.file_path] = []
+    if line_counts is None:
+        line_counts = [_count_lines(read_file(item)) for item in content_items]
+
+    # Group ContentItems by file path, summing their line counts
+    file_groups = defaultdict(list)
+    content_lines = defaultdict(int)
+    for item, line_count in zip(content_items, line_counts):
         file_groups[item.file_path].append(item)
+        content_lines[item.file_path] += line_count
 
     # Calculate the size of each TOC entry (filename + line number)
     # Each file gets one entry, plus one subentry for each range if there are multiple ranges
@@ -63,21 +90,16 @@ def generate_table_of_contents(content_items: List[ContentItem], style=None):
         toc_line_numbers[file_path] = current_line + 3
 
         # Calculate total content lines
-        total_lines = 0
-        for item in items:
-            content = get_content(item)
-            file_lines = len(content.splitlines())
-            total_lines += file_lines
-            # Add a blank line between ranges if there are multiple ranges
-            if len(items) > 1:
-                total_lines += 1
+        total_lines = content_lines[file_path]
+        # Add a blank line between ranges if there are multiple ranges
+        if len(items) > 1:
+            total_lines += len(items)
 
         # Add file lines plus 3 for the header (1 for header, 2 for blank lines)
         current_line += total_lines + 3
 
     # Create TOC with line numbers
-    toc = ""
-    toc += "\n" + create_header("TOC", sequence=None, style=style) + "\n\n"
+    toc_parts = ["\n" + create_header("TOC", sequence=None, style=style) + "\n\n"]
 
     # Format filenames according to header style
     formatted_filenames = {}
@@ -97,37 +119,164 @@ def generate_table_of_contents(content_items: List[ContentItem], style=None):
 
         # Format the TOC entry with dots aligning the line numbers
         dots = "." * (max_filename_length - len(formatted_name) + 5)
-        toc += f"{formatted_name} {dots} {line_num}\n"
+        toc_parts.append(f"{formatted_name} {dots} {line_num}\n")
 
         # Add subentries for ranges if there are multiple ranges
         if len(items) > 1:
             for i, item in enumerate(items):
-                range_info = []
-                for range_obj in item.ranges:
-                    range_info.append(line_range_to_string(range_obj))
-                range_str = ", ".join(range_info)
+                range_str = ", ".join(map(line_range_to_string, item.ranges))
 
                 # Indent the subentry and use a letter index (a, b, c, ...)
-                toc += f"    {chr(97 + i)}. {range_str}\n"
+                toc_parts.append(f"    {chr(97 + i)}. {range_str}\n")
 
-    toc += "\n"
+    toc_parts.append("\n")
 
-    return toc, toc_line_numbers
+    return "".join(toc_parts), toc_line_numbers
 
 
-def process_file(
+def _split_lines(text: str) -> List[str]:
+    """Split text into lines that keep their newline, like iterating a file.
+
+    Unlike str.splitlines, only "\n" ends a line, matching text-mode reads.
+    """
+    lines = [line + "\n" for line in text.split("\n")]
+    lines[-1] = lines[-1][:-1]
+    if not lines[-1]:
+        lines.pop()
+    return lines
+
+
+def read_file(content_item: ContentItem) -> Optional[List[Tuple[int, List[str]]]]:
+    """Read the lines selected by a ContentItem's ranges.
+
+    Small files are read with a single read() call; larger ones are
+    streamed. Only the selected lines are kept, so this is safe to run
+    concurrently for several files.
+
+    Args:
+        content_item (ContentItem): The ContentItem to read.
+
+    Returns:
+        list or None: Runs of consecutive lines in file order, as (first line
+                      number, lines) tuples, or None if the file could not be
+                      found.
+    """
+    try:
+        with open(
+            content_item.file_path, "r", encoding="utf-8", buffering=READ_BUFFER_SIZE
+        ) as f:
+            if os.fstat(f.fileno()).st_size <= SMALL_FILE_SIZE:
+                return _select_lines(_split_lines(f.read()), content_item.ranges)
+            return _stream_lines(f, content_item.ranges)
+    except FileNotFoundError:
+        return None
+
+
+def _count_lines(runs: Optional[List[Tuple[int, List[str]]]]) -> int:
+    """Count the lines read by read_file, treating a missing file as empty.
+
+    Args:
+        runs (list or None): Runs of lines as returned by read_file.
+
+    Returns:
+        int: The number of lines.
+    """
+    if runs is None:
+        return 0
+    return sum(len(lines) for _, lines in runs)
+
+
+def _select_lines(
+    all_lines: List[str], ranges: List[LineRange]
+) -> List[Tuple[int, List[str]]]:
+    """Select the lines in ranges from a file that is already in memory.
+
+    Each range is taken as a slice, so whole files and plain ranges are
+    copied without a Python-level loop over their lines.
+    """
+    runs = []
+    for range_obj in ranges:
+        start, end = normalize_line_range(range_obj, len(all_lines))
+        selected = all_lines[start - 1 : end]
+        if selected:
+            runs.append((start, selected))
+    return _in_file_order(runs)
+
+
+def _stream_lines(f: TextIO, ranges: List[LineRange]) -> List[Tuple[int, List[str]]]:
+    """Select the lines in ranges while streaming a file."""
+    # Open-ended ranges ("X") run to the end of the file, so they never stop
+    # the scan early
+    bounds = [normalize_line_range(range_obj, float("inf")) for range_obj in ranges]
+    if len(bounds) == 1:
+        start, end = bounds[0]
+        lines = list(islice(f, start - 1, None if end == float("inf") else end))
+        return [(start, lines)] if lines else []
+
+    last_line = max(end for _, end in bounds)
+
+    selected = [[] for _ in bounds]
+    for line_num, line in enumerate(f, 1):
+        if line_num > last_line:
+            break
+        for (start, end), lines in zip(bounds, selected):
+            if start <= line_num <= end:
+                lines.append(line)
+    runs = [(start, lines) for (start, _), lines in zip(bounds, selected) if lines]
+    return _in_file_order(runs)
+
+
+def _in_file_order(runs: List[Tuple[int, List[str]]]) -> List[Tuple[int, List[str]]]:
+    """Order runs of lines by line number.
+
+    Ranges may be given in any order. Overlapping ranges repeat their shared
+    lines, which are interleaved line by line as a sort of the individual
+    lines would.
+    """
+    if len(runs) < 2:
+        return runs
+    runs.sort(key=itemgetter(0))
+    if all(
+        start + len(lines) <= next_start
+        for (start, lines), (next_start, _) in zip(runs, runs[1:])
+    ):
+        return runs
+
+    numbered = sorted(
+        (
+            (line_num, line)
+            for start, lines in runs
+            for line_num, line in enumerate(lines, start)
+        ),
+        key=itemgetter(0),
+    )
+    merged = []
+    next_num = None
+    for line_num, line in numbered:
+        if line_num != next_num:
+            merged.append((line_num, []))
+        merged[-1][1].append(line)
+        next_num = line_num + 1
+    return merged
+
+
+def format_file(
     content_item: ContentItem,
+    runs: Optional[List[Tuple[int, List[str]]]],
     line_number_mode: Optional[str],
     line_counter: int,
     show_header: bool = True,
     sequence: Optional[str] = None,
     seq_index: int = 0,
     style: Optional[str] = None,
+    filename: Optional[str] = None,
 ) -> Tuple[str, int]:
-    """Process a single ContentItem and format its content.
+    """Format the lines read for a ContentItem.
 
     Args:
-        content_item (ContentItem): The ContentItem to process.
+        content_item (ContentItem): The ContentItem the lines belong to.
+        runs (list): Runs of lines as returned by read_file, or None if
+                     the file could not be found.
         line_number_mode (str): The line numbering mode ('file', 'all', or None).
         line_counter (int): The current global line counter.
         show_header (bool): Whether to show the header.
@@ -135,65 +284,107 @@ def process_file(
                         or None).
         seq_index (int): The index of the file in the sequence.
         style (str): The header style (filename, path, nice, or None).
+        filename (str, optional): The basename of the file, when the caller
+                                  has already computed it.
 
     Returns:
-        tuple: (str, int) Processed file content with header and line
+        tuple: (str, int) Formatted file content with header and line
                numbers, and the number of lines in the file.
     """
-    logger.debug(
-        f"Processing file: {content_item.file_path}, line_number_mode: {line_number_mode}, "
-        f"line_counter: {line_counter}, ranges: {[line_range_to_string(r) for r in content_item.ranges]}"
-    )
-    try:
-        # Get the content from the ContentItem
-        get_content(content_item)
-
-        # We need to get all lines to determine the actual line numbers
-        with open(content_item.file_path, "r") as f:
-            all_lines = f.readlines()
-
-        # Create a list of lines to include with their original line numbers
-        lines_with_numbers = []
-        for range_obj in content_item.ranges:
-            max_lines = len(all_lines)
-            start, end = normalize_line_range(range_obj, max_lines)
-            for i in range(start - 1, end):
-                if i < len(all_lines):
-                    lines_with_numbers.append((i + 1, all_lines[i]))
-
-        # Sort by line number to maintain order
-        lines_with_numbers.sort(key=lambda x: x[0])
-    except FileNotFoundError:
+    if runs is None:
         return f"Error: File not found: {content_item.file_path}\n", 0
 
-    output = ""
+    parts = []
     if show_header:
+        if filename is None:
+            filename = os.path.basename(content_item.file_path)
+        # Style the basename the caller already has rather than letting
+        # create_header parse the path again
+        styled_name = apply_style_to_filename(filename, style, content_item.file_path)
         header = (
             "\n"
-            + create_header(
-                os.path.basename(content_item.file_path),
-                sequence=sequence,
-                seq_index=seq_index,
-                style=style,
-                original_path=content_item.file_path,
-            )
+            + create_header(styled_name, sequence=sequence, seq_index=seq_index)
             + "\n\n"
         )
-        output = header
+        parts.append(header)
 
-    for i, (line_num, line) in enumerate(lines_with_numbers):
-        line_number = ""
+    # Number each run of lines in one pass; map drives the bound format
+    # method from C instead of bytecode
+    num_lines = 0
+    for start, lines in runs:
         if line_number_mode == "all":
-            line_number = f"{line_counter + i + 1:4d}: "
+            numbered = zip(count(line_counter + num_lines + 1), lines)
+            parts.append("".join(map(LINE_NUMBER_FORMAT, numbered)))
         elif line_number_mode == "file":
-            line_number = f"{line_num:4d}: "
-        output += line_number + line
+            parts.append("".join(map(LINE_NUMBER_FORMAT, zip(count(start), lines))))
+        else:
+            parts.extend(lines)
+        num_lines += len(lines)
 
     # Add a blank line if this is a partial content item (not a full file)
     if not (len(content_item.ranges) == 1 and is_full_file(content_item.ranges[0])):
-        output += "\n"
+        parts.append("\n")
+
+    return "".join(parts), num_lines
 
-    return output, len(lines_with_numbers)
+
+def process_file(
+    content_item: ContentItem,
+    line_number_mode: Optional[str],
+    line_counter: int,
+    show_header: bool = True,
+    sequence: Optional[str] = None,
+    seq_index: int = 0,
+    style: Optional[str] = None,
+) -> Tuple[str, int]:
+    """Process a single ContentItem and format its content.
+
+    Args:
+        content_item (ContentItem): The ContentItem to process.
+        line_number_mode (str): The line numbering mode ('file', 'all', or None).
+        line_counter (int): The current global line counter.
+        show_header (bool): Whether to show the header.
+        sequence (str): The header sequence type (numerical, letter, roman,
+                        or None).
+        seq_index (int): The index of the file in the sequence.
+        style (str): The header style (filename, path, nice, or None).
+
+    Returns:
+        tuple: (str, int) Processed file content with header and line
+               numbers, and the number of lines in the file.
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Processing file: %s, line_number_mode: %s, line_counter: %s, "
+            "ranges: %s",
+            content_item.file_path,
+            line_number_mode,
+            line_counter,
+            [line_range_to_string(r) for r in content_item.ranges],
+        )
+    return format_file(
+        content_item,
+        read_file(content_item),
+        line_number_mode,
+        line_counter,
+        show_header,
+        sequence,
+        seq_index,
+        style,
+    )
+
+
+def _read_ahead(
+    executor: ThreadPoolExecutor, content_items: List[ContentItem], window: int
+) -> Iterator[Optional[List[Tuple[int, List[str]]]]]:
+    """Yield read_file results in order with at most window reads in flight."""
+    pending = deque()
+    for item in content_items:
+        pending.append(executor.submit(read_file, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
 
 def process_all(
@@ -203,10 +394,13 @@ def process_all(
     show_header: bool = True,
     sequence: Optional[str] = None,
     style: Optional[str] = None,
-) -> str:
+    out: Optional[TextIO] = None,
+) -> Optional[str]:
     """Process all ContentItems and combine them into a single document.
 
     This is the main entry point for both command-line usage and testing.
+    When an output stream is given, each block is written to it as soon as
+    it is formatted instead of building the whole document in memory.
 
     Args:
         content_items (list): List of ContentItem objects.
@@ -216,54 +410,71 @@ def process_all(
         sequence (str): The header sequence type (numerical, letter, roman,
                         or None).
         style (str): The header style (filename, path, nice, or None).
+        out (TextIO, optional): Stream to write the document to.
 
     Returns:
-        str: The combined content of all files with formatting.
+        str or None: The combined content of all files with formatting, or
+                     None if it was written to out.
     """
     logger.debug(
-        f"Processing all files, line_number_mode: {line_number_mode}, "
-        f"generate_toc: {generate_toc}"
+        "Processing all files, line_number_mode: %s, generate_toc: %s",
+        line_number_mode,
+        generate_toc,
     )
-    output_buffer = ""
-    line_counter = 0
-
-    # Group ContentItems by file path
-    file_groups = {}
+    # Without an output stream, accumulate the document in memory and
+    # return it at the end
+    buffer = None
+    if out is None:
+        buffer = out = io.StringIO()
+
+    # Group ContentItems by file path; the output follows the groups, so the
+    # items are read in that order
+    file_groups = defaultdict(list)
     for item in content_items:
-        if item.file_path not in file_groups:
-            file_groups[item.file_path] = []
         file_groups[item.file_path].append(item)
-
-    # Generate table of contents if needed
-    toc = ""
-    if generate_toc:
-        toc, _ = generate_table_of_contents(content_items, style)
-
-    # Reset line counter for actual file processing
-    line_counter = 0
-
-    # Process each file group
-    file_index = 0
-    for file_path, items in file_groups.items():
-        # Process each ContentItem for this file
-        for item in items:
-            if line_number_mode == "file":
-                line_counter = 0
-
-            file_output, num_lines = process_file(
-                item,
-                line_number_mode,
-                line_counter,
-                show_header,
-                sequence,
-                file_index,
-                style,
-            )
-            output_buffer += file_output
-            line_counter += num_lines
-        file_index += 1
-
-    if generate_toc:
-        output_buffer = toc + output_buffer
-
-    return output_buffer
+    ordered_items = [item for items in file_groups.values() for item in items]
+
+    # Read files concurrently, exactly once; the GIL is released while
+    # waiting on I/O. Results come back in order so the output stays
+    # deterministic.
+    max_workers = min(32, len(content_items) or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        if generate_toc:
+            # The TOC is written first and needs every line count, so all
+            # files are read before any content is written
+            item_runs = list(executor.map(read_file, ordered_items))
+            line_counts = [_count_lines(runs) for runs in item_runs]
+            toc, _ = generate_table_of_contents(ordered_items, style, line_counts)
+            out.write(toc)
+        else:
+            # Otherwise each file is written and dropped as soon as its read
+            # completes, keeping only a few files in memory at a time
+            item_runs = _read_ahead(executor, ordered_items, READ_AHEAD)
+        results = iter(item_runs)
+
+        line_counter = 0
+        for file_index, (file_path, items) in enumerate(file_groups.items()):
+            # All ranges of a file share its header name, so parse the path
+            # once
+            filename = os.path.basename(file_path)
+
+            # Process each ContentItem for this file
+            for item in items:
+                if line_number_mode == "file":
+                    line_counter = 0
+
+                file_output, num_lines = format_file(
+                    item,
+                    next(results),
+                    line_number_mode,
+                    line_counter,
+                    show_header,
+                    sequence,
+                    file_index,
+                    style,
+                    filename,
+                )
+                out.write(file_output)
+                line_counter += num_lines
+
+    return buffer.getvalue() if buffer is not None else None
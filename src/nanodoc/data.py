@@ -1,7 +1,12 @@
 import os
+import stat
 from dataclasses import dataclass
 from typing import List, Optional, Tuple, Union
 
+# Buffer size for content reads: larger than the 8 KiB default so big files
+# need fewer read() syscalls
+READ_BUFFER_SIZE = 1 << 17
+
 
 @dataclass
 class LineRange:
@@ -95,21 +100,32 @@ def validate_content_item(content_item: ContentItem) -> bool:
         IsADirectoryError: If the path is a directory.
         ValueError: If a line reference is invalid or out of range.
     """
-    # Check file existence and readability
-    if not os.path.exists(content_item.file_path):
+    # Check file existence and readability, reusing a single stat result
+    try:
+        file_stat = os.stat(content_item.file_path)
+    except OSError:
         raise FileNotFoundError(f"File not found: {content_item.file_path}")
     if not os.access(content_item.file_path, os.R_OK):
         raise PermissionError(f"File is not readable: {content_item.file_path}")
-    if os.path.isdir(content_item.file_path):
+    if stat.S_ISDIR(file_stat.st_mode):
         raise IsADirectoryError(
             f"Path is a directory, not a file: {content_item.file_path}"
         )
 
-    # Validate ranges against file content
-    with open(content_item.file_path, "r") as f:
-        lines = f.readlines()
+    # Validate ranges against file content. Reading also checks that the
+    # file decodes, so a bad file fails before any output is written.
+    ranges = content_item.ranges
+    with open(
+        content_item.file_path, "r", encoding="utf-8", buffering=READ_BUFFER_SIZE
+    ) as f:
+        # A whole-file reference is valid for any non-empty file, so it only
+        # needs decoding, not splitting into lines to count them
+        if file_stat.st_size and all(is_full_file(range_obj) for range_obj in ranges):
+            while f.read(READ_BUFFER_SIZE):
+                pass
+            return True
+        max_lines = sum(1 for _ in f)
 
-    max_lines = len(lines)
     for range_obj in content_item.ranges:
         start, end = normalize_line_range(range_obj, max_lines)
         if start <= 0 or end <= 0 or start > max_lines or end > max_lines:
@@ -152,7 +168,9 @@ def load_content(content_item: ContentItem) -> str:
     if content_item.content is not None:
         return content_item.content
 
-    with open(content_item.file_path, "r") as f:
+    with open(
+        content_item.file_path, "r", encoding="utf-8", buffering=READ_BUFFER_SIZE
+    ) as f:
         all_lines = f.readlines()
 
     max_lines = len(all_lines)
@@ -6,15 +6,29 @@
 
 import logging
 import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from typing import List, Tuple
 import re
 
-from .data import ContentItem, LineRange
+from .data import READ_BUFFER_SIZE, ContentItem, LineRange
 from .data import get_content as get_item_content
 from .data import validate_content_item
 
-# Define text file extensions
-TXT_EXTENSIONS = [".txt", ".md"]
+# Define text file extensions; a tuple so it is safe as a default argument
+# and can be handed straight to str.endswith
+TXT_EXTENSIONS = (".txt", ".md")
+
+# Sort priority of the default extensions; this ensures test_file.txt comes
+# before test_file.md, and any other extension after both
+EXTENSION_PRIORITY = {TXT_EXTENSIONS[0]: 0, TXT_EXTENSIONS[1]: 1}
+
+# Size of each raw read when probing files for bundle content
+PROBE_READ_SIZE = 4096
+
+# Characters allowed in a line reference such as "L5-10,L20-X"
+LINE_REF_CHARS = frozenset("L0123456789,-X")
 
 logger = logging.getLogger("nanodoc")
 logger.setLevel(logging.CRITICAL)  # Start with logging disabled
@@ -38,9 +52,8 @@ def parse_line_reference(line_ref: str) -> List[LineRange]:
         raise ValueError("Empty line reference")
 
     # Check for invalid characters in the line reference
-    valid_chars = set("L0123456789,-X")
     for char in line_ref:
-        if char not in valid_chars:
+        if char not in LINE_REF_CHARS:
             raise ValueError(f"Invalid character in line reference: '{char}'")
 
     ranges = []
@@ -187,6 +200,11 @@ def verify_content(content_item: ContentItem) -> ContentItem:
     return content_item
 
 
+def _create_verified_item(arg: str) -> ContentItem:
+    """Create a ContentItem from an argument and verify it."""
+    return verify_content(create_content_item(arg))
+
+
 def get_file_content(file_path, line=None, start=None, end=None, parts=None):
     """Get content from a file, optionally selecting specific lines or ranges.
 
@@ -207,17 +225,29 @@ def get_file_content(file_path, line=None, start=None, end=None, parts=None):
     """
     # If parts is a list of LineRange objects, convert it to tuples
     if parts and isinstance(parts[0], LineRange):
-        with open(file_path, "r") as f:
-            max_lines = len(f.readlines())
+        with open(file_path, "r", encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+            max_lines = sum(1 for _ in f)
         parts = convert_line_ranges_to_tuples(parts, max_lines)
 
     # If we have a ContentItem, use its get_content method
     if isinstance(file_path, ContentItem):
         return get_item_content(file_path)
 
+    # Only read as far as the last requested line. If the file ends before
+    # it, everything has been read anyway, so out-of-range errors still
+    # report the real line count.
+    requested = []
+    if line is not None:
+        requested = [line]
+    elif start is not None and end is not None:
+        requested = [start, end]
+    elif parts:
+        requested = [number for part in parts for number in part]
+    last_line = max(requested) if requested and min(requested) > 0 else None
+
     try:
-        with open(file_path, "r") as f:
-            lines = f.readlines()
+        with open(file_path, "r", encoding="utf-8", buffering=READ_BUFFER_SIZE) as f:
+            lines = f.readlines() if last_line is None else list(islice(f, last_line))
     except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {file_path}")
 
@@ -277,20 +307,40 @@ def expand_directory(directory, extensions=TXT_EXTENSIONS):
 
     Args:
         directory (str): The directory path to search.
-        extensions (list): List of file extensions to include.
+        extensions (list or tuple): File extensions to include.
 
     Returns:
-        list: A sorted list of file paths matching the extensions (not validated).
+        list: A sorted list of file paths matching the extensions (not
+              validated). Sorting here keeps same-named files from different
+              subdirectories in a deterministic order once callers sort by
+              file_sort_key.
     """
     logger.debug(
-        f"Expanding directory with directory='{directory}', "
-        f"extensions='{extensions}'"
+        "Expanding directory with directory='%s', extensions='%s'",
+        directory,
+        extensions,
     )
+    # str.endswith accepts a tuple, which avoids a Python-level loop per file
+    if not isinstance(extensions, tuple):
+        extensions = tuple(extensions)
     matches = []
-    for root, _, filenames in os.walk(directory):
-        for filename in filenames:
-            if any(filename.endswith(ext) for ext in extensions):
-                matches.append(os.path.join(root, filename))
+    pending = [directory]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            # Unreadable directories are skipped, as os.walk would do
+            continue
+        with entries:
+            for entry in entries:
+                # DirEntry caches the type from the directory listing, so this
+                # avoids a separate stat per entry. Symlinked directories are
+                # not descended into.
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        pending.append(entry.path)
+                elif entry.name.endswith(extensions):
+                    matches.append(entry.path)
     return sorted(matches)
 
 
@@ -364,7 +414,7 @@ def process_mixed_content_bundle(lines):
                 file_content = get_file_content(stripped_line)
                 result.append(file_content)
             except Exception as e:
-                logger.warning(f"Error reading file {stripped_line}: {e}")
+                logger.warning("Error reading file %s: %s", stripped_line, e)
                 # Keep the original line if file can't be read
                 result.append(line)
         else:
@@ -383,7 +433,7 @@ def process_mixed_content_bundle(lines):
                             # Replace the @[file path] with the inline content
                             processed_line = processed_line.replace(f'@[{file_path}]', inline_content)
                         except Exception as e:
-                            logger.warning(f"Error reading inline file {file_path}: {e}")
+                            logger.warning("Error reading inline file %s: %s", file_path, e)
                             # Keep the original reference if file can't be read
                 result.append(processed_line)
             else:
@@ -408,7 +458,7 @@ def process_mixed_content_bundle(lines):
                     # Replace the @[file path] with the inline content
                     processed_result = processed_result.replace(f'@[{file_path}]', inline_content)
                 except Exception as e:
-                    logger.warning(f"Error reading inline file {file_path}: {e}")
+                    logger.warning("Error reading inline file %s: %s", file_path, e)
                     # Keep the original reference if file can't be read
         return processed_result
     
@@ -424,10 +474,9 @@ def process_traditional_bundle(lines):
     Returns:
         list: A list of file paths.
     """
+    # Strip each line once, in C, and filter the stripped values
     return [
-        line.strip()
-        for line in lines
-        if line.strip() and not line.strip().startswith("#")
+        line for line in map(str.strip, lines) if line and not line.startswith("#")
     ]
 
 
@@ -458,7 +507,7 @@ def expand_bundles(bundle_file):
         file_path, line_ref = bundle_file.split(":L", 1)
         line_ref = "L" + line_ref
 
-    logger.debug(f"Expanding bundles from file: {bundle_file}")
+    logger.debug("Expanding bundles from file: %s", bundle_file)
 
     try:
         # If there's a line reference, only read the specified lines
@@ -488,6 +537,44 @@ def expand_bundles(bundle_file):
         return process_traditional_bundle(lines)
 
 
+def _read_raw_lines(file_path):
+    """Yield the lines of a file using unbuffered os.read calls.
+
+    Bundle probes usually only look at a few short lines, so this skips the
+    text wrapper and buffer setup of open(); most bundles fit in one read.
+
+    Args:
+        file_path (str): The path to the file to read.
+
+    Yields:
+        str: Each line of the file, without its trailing newline.
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        # Pieces of the unfinished line; only the new chunk is split, so a
+        # long line spanning many reads is joined once rather than re-copied
+        # on every read
+        pending = []
+        while True:
+            chunk = os.read(fd, PROBE_READ_SIZE)
+            if not chunk:
+                break
+            lines = chunk.split(b"\n")
+            if len(lines) == 1:
+                pending.append(chunk)
+                continue
+            pending.append(lines[0])
+            yield b"".join(pending).decode("utf-8", "replace")
+            for line in lines[1:-1]:
+                yield line.decode("utf-8", "replace")
+            pending = [lines[-1]]
+        tail = b"".join(pending)
+        if tail:
+            yield tail.decode("utf-8", "replace")
+    finally:
+        os.close(fd)
+
+
 def is_bundle_file(file_path):
     """Determine if a file is a bundle file by checking its contents.
 
@@ -501,37 +588,21 @@ def is_bundle_file(file_path):
     Returns:
         bool: True if the file appears to be a bundle file, False otherwise.
     """
-    logger.debug(f"Checking if {file_path} is a bundle file")
+    logger.debug("Checking if %s is a bundle file", file_path)
     try:
-        with open(file_path, "r") as f:
-            lines = f.readlines()
-            
-            # First check: traditional bundle detection
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if os.path.isfile(line):
-                    return True
-                else:
-                    # If we find a non-file line, check for mixed content
-                    break
-            
-            # Second check: mixed content bundle detection
-            has_file_path = False
-            for line in lines:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if os.path.isfile(line):
-                    has_file_path = True
-                    break
-            
-            return has_file_path
+        # A single pass covers both traditional and mixed content bundles:
+        # stop at the first line that names an existing file
+        for line in _read_raw_lines(file_path):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if os.path.isfile(line):
+                return True
+        return False
     except FileNotFoundError:
         return False
     except Exception as e:
-        logger.error(f"Error checking bundle file: {e}")
+        logger.error("Error checking bundle file: %s", e)
         return False
 
 
@@ -546,16 +617,22 @@ def expand_single_arg(arg, extensions=None):
     Returns:
         list: A list of expanded file paths.
     """
-    logger.debug(f"Expanding argument: {arg}")
+    logger.debug("Expanding argument: %s", arg)
 
     # Extract file path if there's a line reference
     file_path = arg
     if ":L" in arg:
         file_path = arg.split(":L", 1)[0]
 
-    if os.path.isdir(arg):  # Directory path
+    # A single stat tells directories, regular files and missing paths apart
+    try:
+        mode = os.stat(file_path).st_mode
+    except OSError:
+        return [arg]  # Missing path, reported when the ContentItem is verified
+
+    if stat.S_ISDIR(mode) and file_path == arg:  # Directory path
         return expand_directory(arg, extensions=extensions)
-    elif is_bundle_file(file_path):  # Bundle file
+    elif stat.S_ISREG(mode) and is_bundle_file(file_path):  # Bundle file
         bundle_result = expand_bundles(arg)
         if isinstance(bundle_result, str):
             # This is a mixed content bundle - create a temporary file
@@ -588,14 +665,17 @@ def expand_args(args, extensions=None):
     Returns:
         list: A flattened list of file paths (not validated).
     """
-    logger.debug(f"Expanding arguments: {args}")
+    logger.debug("Expanding arguments: %s", args)
     
     # Use default extensions if none provided
     if extensions is None:
         extensions = TXT_EXTENSIONS
 
-    # Use list comprehension with sum to flatten the list of lists
-    return sum([expand_single_arg(arg, extensions) for arg in args], [])
+    # Flatten with chain rather than sum(), which copies the growing list for
+    # every argument
+    return list(
+        chain.from_iterable(expand_single_arg(arg, extensions) for arg in args)
+    )
 
 
 def verify_path(path):
@@ -619,7 +699,7 @@ def verify_path(path):
         IsADirectoryError: If the path is a directory.
         ValueError: If the line reference is invalid or out of range.
     """
-    logger.debug(f"Verifying file path: {path}")
+    logger.debug("Verifying file path: %s", path)
 
     # Check if the path includes a line reference
     file_path = path
@@ -669,11 +749,8 @@ def file_sort_key(path):
     """Key function for sorting files by name then extension priority."""
     if isinstance(path, ContentItem):
         path = path.file_path
-    base_name = os.path.splitext(os.path.basename(path))[0]
-    ext = os.path.splitext(path)[1]
-    # This ensures test_file.txt comes before test_file.md
-    ext_priority = 0 if ext == TXT_EXTENSIONS[0] else 1 if ext == TXT_EXTENSIONS[1] else 2
-    return (base_name, ext_priority)
+    base_name, ext = os.path.splitext(os.path.basename(path))
+    return (base_name, EXTENSION_PRIORITY.get(ext, 2))
 
 
 def get_files_from_args(srcs, extensions=None):
@@ -702,15 +779,14 @@ def get_files_from_args(srcs, extensions=None):
     if not expanded_files:
         return []
 
-    # Phase 2: Create and validate ContentItems
-    content_items = []
-    for file_path in expanded_files:
-        # Create a ContentItem
-        content_item = create_content_item(file_path)
-        # Validate the ContentItem
-        verify_content(content_item)
-        content_items.append(content_item)
+    # Phase 2: Create and validate ContentItems. Validation stats and reads
+    # each file, so it runs concurrently. Each path is parsed and validated
+    # in the same task and results come back in input order, so the first
+    # invalid argument still raises as it would serially.
+    max_workers = min(32, len(expanded_files))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        content_items = list(executor.map(_create_verified_item, expanded_files))
 
     # Sort the content items
-    content_items.sort(key=lambda x: file_sort_key(x.file_path))
+    content_items.sort(key=file_sort_key)
     return content_items
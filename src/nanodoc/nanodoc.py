@@ -132,11 +132,12 @@ def setup_logging(to_stderr=False, enabled=False):
         logger: Configured logging object.
     """
     global logger
-    if not logger.hasHandlers():  # Only set up logging once
-        # Set initial log level
-        level = logging.DEBUG if enabled else logging.CRITICAL
-        logger.setLevel(level)
+    level = logging.DEBUG if enabled else logging.CRITICAL
+    logger.setLevel(level)
 
+    # Only attach a handler once logging is actually enabled, so a disabled
+    # run never builds a handler or formatter
+    if enabled and not logger.hasHandlers():
         # Create handler to the appropriate stream
         stream = sys.stderr if to_stderr else sys.stdout
         handler = logging.StreamHandler(stream)
@@ -145,10 +146,6 @@ def setup_logging(to_stderr=False, enabled=False):
         )
         handler.setFormatter(formatter)
         logger.addHandler(handler)
-    else:
-        # If handlers are already set, just adjust the level
-        level = logging.DEBUG if enabled else logging.CRITICAL
-        logger.setLevel(level)
     return logger
 
 
@@ -274,15 +271,17 @@ def main():
             print("Error: No valid source files found.", file=sys.stderr)
             sys.exit(1)
 
-        output = process_all(
+        # Stream the document to stdout as each file is formatted
+        process_all(
             content_items,
             args.line_number_mode,
             args.toc,
             not args.no_header,
             args.sequence,
             args.style,
+            out=sys.stdout,
         )
-        print(output)
+        sys.stdout.write("\n")
     except Exception as e:
         print(f"An error occurred: {e}", file=sys.stderr)
         sys.exit(1)
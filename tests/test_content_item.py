@@ -169,6 +169,28 @@ def test_content_item_validate(tmpdir):
         validate_content_item(content_item)
 
 
+def test_content_item_validate_full_file(tmpdir):
+    # A whole-file reference is valid for any non-empty file
+    test_file = tmpdir.join("test_file.txt")
+    test_file.write("Line 1")
+    file_path = str(test_file)
+    content_item = ContentItem(file_path, file_path, [LineRange(1, "X")])
+    assert validate_content_item(content_item) is True
+
+    # An empty file has no lines to reference
+    empty_file = tmpdir.join("empty_file.txt")
+    empty_file.write("")
+    file_path = str(empty_file)
+    content_item = ContentItem(file_path, file_path, [LineRange(1, "X")])
+    with pytest.raises(ValueError, match="file has 0 lines"):
+        validate_content_item(content_item)
+
+    # Directories are rejected
+    content_item = ContentItem(str(tmpdir), str(tmpdir), [LineRange(1, "X")])
+    with pytest.raises(IsADirectoryError):
+        validate_content_item(content_item)
+
+
 def test_content_item_get_content(tmpdir):
     # Test getting content from a ContentItem
     test_file = tmpdir.join("test_file.txt")
@@ -272,3 +294,28 @@ def test_get_files_from_args(tmpdir):
     assert content_items[0].file_path == file_path1
     assert content_items[0].ranges[0].start == 2
     assert content_items[0].ranges[0].end == 2
+
+
+def test_get_files_from_args_raises_in_argument_order(tmpdir):
+    # A missing earlier file is reported before a bad line reference in a
+    # later argument
+    test_file = tmpdir.join("test_file.txt")
+    test_file.write("Line 1\nLine 2")
+    missing_file = str(tmpdir.join("missing.txt"))
+
+    with pytest.raises(FileNotFoundError):
+        get_files_from_args([missing_file, f"{test_file}:L2-1-3"])
+
+
+def test_get_files_from_args_keeps_argument_order_for_same_name(tmpdir):
+    # Files with the same name keep the order they were given in
+    test_file1 = tmpdir.mkdir("d2").join("a-file.txt")
+    test_file1.write("Line 1")
+    test_file2 = tmpdir.mkdir("d").join("a-file.txt")
+    test_file2.write("Line 2")
+
+    content_items = get_files_from_args([str(test_file1), str(test_file2)])
+    assert [item.file_path for item in content_items] == [
+        str(test_file1),
+        str(test_file2),
+    ]
@@ -172,3 +172,24 @@ def test_e2e_bundle_with_nn_and_toc(tmpdir):
                 found_entry = True
                 break
         assert found_entry, f"TOC entry format incorrect for {filename}"
+
+
+def test_e2e_non_utf8_file_writes_nothing(tmpdir):
+    """
+    End-to-end test: a file that is not valid UTF-8 fails before any output
+    is written, so redirected output is never left truncated.
+    """
+    ok_file = tmpdir.join("a-ok.txt")
+    ok_file.write("Some content\n")
+    # Sorted after the valid file, so its content would be written first
+    latin1_file = tmpdir.join("z-latin1.txt")
+    latin1_file.write_binary(b"caf\xe9\n")
+
+    result = subprocess.run(
+        [PYTHON_CMD, "-m", NANODOC_MODULE, str(ok_file), str(latin1_file)],
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 1
+    assert result.stdout == ""
@@ -69,6 +69,12 @@ def test_create_header_with_nice_style():
     assert header == "Test File (test_file.txt)"
 
 
+def test_create_header_styles_original_path_basename():
+    # With original_path set, the styled name comes from the path, not text
+    header = create_header("Intro", style="nice", original_path="/x/intro-guide.md")
+    assert header == "Intro Guide (intro-guide.md)"
+
+
 def test_create_header_long_text():
     text = "This is a very long header that exceeds the maximum line width"
     header = create_header(text)
@@ -110,3 +110,35 @@ def test_is_bundle_file_with_multiple_lines_and_invalid_paths(tmpdir):
     # With the new implementation, a file is considered a bundle if any line
     # is a valid file path, so this should return True
     assert is_bundle_file(str(bundle_file))
+
+
+def test_is_bundle_file_with_path_after_large_text(tmpdir):
+    # Create a test file that will be referenced in the bundle
+    test_file = tmpdir.join("referenced_file.txt")
+    test_file.write("Some content")
+
+    # The file path sits well past the first raw read
+    bundle_file = tmpdir.join("long_bundle.txt")
+    bundle_file.write("Some text line\n" * 1000 + str(test_file) + "\n")
+
+    assert is_bundle_file(str(bundle_file))
+
+
+def test_is_bundle_file_with_large_file_without_newlines(tmpdir):
+    # A single line spanning many raw reads is not a bundle
+    content_file = tmpdir.join("one_line.txt")
+    content_file.write("x" * (4 * 1024 * 1024))
+
+    assert not is_bundle_file(str(content_file))
+
+
+def test_is_bundle_file_with_path_after_long_line(tmpdir):
+    # Create a test file that will be referenced in the bundle
+    test_file = tmpdir.join("referenced_file.txt")
+    test_file.write("Some content")
+
+    # The first line spans several raw reads before the path appears
+    bundle_file = tmpdir.join("long_line_bundle.txt")
+    bundle_file.write("y" * 10000 + "\n" + str(test_file) + "\n")
+
+    assert is_bundle_file(str(bundle_file))
@@ -1,6 +1,6 @@
 import os
 
-from nanodoc.core import process_file
+from nanodoc.core import format_file, process_file, read_file
 from nanodoc.files import create_content_item
 
 
@@ -98,3 +98,61 @@ def test_process_file_with_header_style(tmpdir):
         style="nice",
     )
     assert "\n1. Test File (test_file.txt)\n\n" in output
+
+
+def test_read_file_selected_lines(tmpdir):
+    test_file = tmpdir.join("test_file.txt")
+    test_file.write("Line 1\nLine 2\nLine 3\nLine 4\nLine 5\n")
+    file_path = str(test_file)
+    lines = read_file(create_content_item(f"{file_path}:L4-X,L2"))
+    assert lines == [(2, ["Line 2\n"]), (4, ["Line 4\n", "Line 5\n"])]
+
+
+def test_read_file_not_found():
+    assert read_file(create_content_item("nonexistent_file.txt")) is None
+
+
+def test_format_file_with_read_lines(tmpdir):
+    test_file = tmpdir.join("test_file.txt")
+    test_file.write("Line 1\nLine 2\nLine 3\n")
+    content_item = create_content_item(f"{test_file}:L2-3")
+    output, num_lines = format_file(
+        content_item, read_file(content_item), "all", 10, show_header=False
+    )
+    assert output == "  11: Line 2\n  12: Line 3\n\n"
+    assert num_lines == 2
+
+
+def test_read_file_small_and_large_files(tmpdir):
+    # Form feeds are not line breaks, and the last line has no newline
+    small_file = tmpdir.join("small.txt")
+    small_file.write("Line\f A\nLine B\nLast")
+    large_file = tmpdir.join("large.txt")
+    large_file.write("Line\f A\nLine B\n" * 5000 + "Last")
+
+    small = read_file(create_content_item(str(small_file)))
+    assert small == [(1, ["Line\f A\n", "Line B\n", "Last"])]
+
+    large = read_file(create_content_item(str(large_file)))
+    assert len(large) == 1
+    start, lines = large[0]
+    assert start == 1
+    assert len(lines) == 10001
+    assert lines[0] == "Line\f A\n"
+    assert lines[-1] == "Last"
+
+
+def test_read_file_unordered_ranges(tmpdir):
+    # Ranges come back in file order whether the file is sliced or streamed
+    small_file = tmpdir.join("small.txt")
+    small_file.write("".join(f"Line {i}\n" for i in range(1, 11)))
+    large_file = tmpdir.join("large.txt")
+    large_file.write("".join(f"Line {i}\n" for i in range(1, 20001)))
+
+    for path in (small_file, large_file):
+        lines = read_file(create_content_item(f"{path}:L5-6,L2,L6"))
+        assert lines == [
+            (2, ["Line 2\n"]),
+            (5, ["Line 5\n", "Line 6\n"]),
+            (6, ["Line 6\n"]),
+        ]
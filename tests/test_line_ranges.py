@@ -93,6 +93,18 @@ def test_get_file_content_multiple_parts(tmpdir):
     assert content == "Line 1\nLine 3\nLine 4"
 
 
+def test_get_file_content_out_of_range(tmpdir):
+    # Out-of-range references still report the real line count
+    test_file = tmpdir.join("test_file.txt")
+    test_file.write("Line 1\nLine 2\nLine 3\nLine 4\nLine 5")
+    file_path = str(test_file)
+
+    with pytest.raises(ValueError, match="file has 5 lines"):
+        get_file_content(file_path, line=6)
+    with pytest.raises(ValueError, match="file has 5 lines"):
+        get_file_content(file_path, parts=[(2, 3), (4, 9)])
+
+
 def test_get_file_content_line_out_of_range(tmpdir):
     # Test getting a line that is out of range
     test_file = tmpdir.join("test_file.txt")
@@ -1,3 +1,5 @@
+import io
+
 from nanodoc.core import process_all
 from nanodoc.files import create_content_item
 
@@ -134,3 +136,36 @@ def test_process_all_with_toc_and_multiple_ranges(tmpdir):
     assert "test_file.txt" in result
     assert "a. L1-2" in result
     assert "b. L4-5" in result
+
+
+def test_process_all_writes_to_stream(tmpdir):
+    # Test streaming the document to an output stream
+    test_file = tmpdir.join("test_file.txt")
+    test_file.write("Line 1\nLine 2\nLine 3")
+    content_item = create_content_item(str(test_file))
+
+    out = io.StringIO()
+    result = process_all([content_item], generate_toc=True, out=out)
+
+    # Nothing is returned; the stream holds the same document
+    assert result is None
+    assert out.getvalue() == process_all([content_item], generate_toc=True)
+
+
+def test_process_all_streams_files_in_group_order(tmpdir):
+    # More files than are read ahead, with a second range of the first file
+    # given last; its output still follows the first range
+    content_items = []
+    for i in range(20):
+        test_file = tmpdir.join(f"test_file{i:02d}.txt")
+        test_file.write(f"File {i} Line 1\nFile {i} Line 2\n")
+        content_items.append(create_content_item(f"{test_file}:L1"))
+    content_items.append(create_content_item(f"{tmpdir.join('test_file00.txt')}:L2"))
+
+    out = io.StringIO()
+    process_all(content_items, line_number_mode="all", out=out)
+    result = out.getvalue()
+
+    assert result.index("   1: File 0 Line 1") < result.index("   2: File 0 Line 2")
+    assert result.index("   2: File 0 Line 2") < result.index("   3: File 1 Line 1")
+    assert "  21: File 19 Line 1" in result
@@ -1,3 +1,5 @@
+import os
+
 from nanodoc.core import generate_table_of_contents, process_all
 from nanodoc.files import create_content_item
 
@@ -126,3 +128,41 @@ def test_process_all_with_header_style(tmpdir):
 
     output = process_all(file_paths, None, False, style="nice")
     assert "Test File1 (test_file1.txt)" in output
+
+
+def test_generate_table_of_contents_with_line_counts(tmpdir):
+    test_file1 = tmpdir.join("test_file1.txt")
+    test_file1.write("Line 1\nLine 2")
+    test_file2 = tmpdir.join("test_file2.txt")
+    test_file2.write("Line 3\nLine 4")
+    file_paths = [
+        create_content_item(str(test_file1)),
+        create_content_item(str(test_file2)),
+    ]
+
+    # Precomputed counts give the same result without loading the content
+    expected = generate_table_of_contents(file_paths)
+    for item in file_paths:
+        item.content = None
+    assert generate_table_of_contents(file_paths, line_counts=[2, 2]) == expected
+    assert all(item.content is None for item in file_paths)
+
+
+def test_generate_table_of_contents_counts_trailing_blank_lines(tmpdir):
+    # Trailing blank lines are part of the output, so the TOC entry for the
+    # next file must account for them
+    test_file1 = tmpdir.join("test_file1.txt")
+    test_file1.write("a\nb\n\n\n")
+    test_file2 = tmpdir.join("test_file2.txt")
+    test_file2.write("c\n")
+    file_paths = [
+        create_content_item(str(test_file1)),
+        create_content_item(str(test_file2)),
+    ]
+
+    _, toc_line_numbers = generate_table_of_contents(file_paths)
+    output_lines = process_all(file_paths, generate_toc=True).split("\n")
+
+    for item in file_paths:
+        line_num = toc_line_numbers[item.file_path]
+        assert output_lines[line_num - 1] == os.path.basename(item.file_path)